@@ -6,9 +6,9 @@ All favicon raster variants are resized from the VP monogram artwork.
 
 from __future__ import annotations
 
+import io
 import json
 import struct
-import zlib
 from pathlib import Path
 
 from PIL import Image
@@ -19,32 +19,11 @@ OUT = ROOT / "docs" / "content" / "assets" / "favicon"
 VP_MONOGRAM = ROOT / "assets" / "logo-vp.png"
 
 
-def png_chunk(tag: bytes, data: bytes) -> bytes:
-    return (
-        struct.pack(">I", len(data))
-        + tag
-        + data
-        + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
-    )
-
-
-def encode_png(width: int, height: int, rgba: bytes) -> bytes:
-    stride = width * 4
-    rows = []
-    for y in range(height):
-        row = rgba[y * stride : (y + 1) * stride]
-        rows.append(b"\x00" + row)
-    raw = b"".join(rows)
-
-    signature = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
-    idat = zlib.compress(raw, 9)
-    return signature + png_chunk(b"IHDR", ihdr) + png_chunk(b"IDAT", idat) + png_chunk(b"IEND", b"")
-
-
-def write_logo_png(path: Path, logo: Image.Image, size: int) -> bytes:
+def write_logo_png(path: Path, logo: Image.Image, size: int, level: int = 6) -> bytes:
     resized = logo.resize((size, size), Image.Resampling.LANCZOS)
-    png = encode_png(size, size, resized.tobytes())
+    buf = io.BytesIO()
+    resized.save(buf, format="PNG", compress_level=level)
+    png = buf.getvalue()
     path.write_bytes(png)
     return png
 
@@ -120,12 +99,17 @@ def main() -> None:
     with Image.open(VP_MONOGRAM) as src:
         monogram = normalize_monogram(src)
 
-    png16 = write_logo_png(OUT / "favicon-16x16.png", monogram, 16)
-    png32 = write_logo_png(OUT / "favicon-32x32.png", monogram, 32)
-    png48 = write_logo_png(OUT / "favicon-48x48.png", monogram, 48)
-    write_logo_png(OUT / "apple-touch-icon.png", monogram, 180)
-    write_logo_png(OUT / "android-chrome-192x192.png", monogram, 192)
-    write_logo_png(OUT / "android-chrome-512x512.png", monogram, 512)
+    # Resample the full-size artwork once; smaller variants are derived from
+    # this base, and the tiny ones from a cheap box-filtered 256px copy.
+    base = monogram.resize((512, 512), Image.Resampling.LANCZOS)
+    small = base.reduce(2)
+
+    png16 = write_logo_png(OUT / "favicon-16x16.png", small, 16, level=1)
+    png32 = write_logo_png(OUT / "favicon-32x32.png", small, 32, level=1)
+    png48 = write_logo_png(OUT / "favicon-48x48.png", small, 48, level=1)
+    write_logo_png(OUT / "apple-touch-icon.png", base, 180)
+    write_logo_png(OUT / "android-chrome-192x192.png", base, 192)
+    write_logo_png(OUT / "android-chrome-512x512.png", base, 512)
 
     write_ico(OUT / "favicon.ico", [(16, png16), (32, png32), (48, png48)])
     write_manifest(OUT / "site.webmanifest")